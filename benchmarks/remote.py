@@ -0,0 +1,87 @@
+"""
+End-to-end throughput and fairness of an `EnvServer` shared by several
+clients on localhost. The server hosts one group of envs, each client leases
+a part of it and steps with random actions for a fixed duration:
+
+    $ python benchmarks/remote.py --env-id op2-xh035-v1 --clients 4 \\
+                                  --envs-per-client 4 --duration 10
+
+Reported are the steps per second of each client and overall, as well as the
+ratio between the slowest and the fastest client (1.0 = perfectly fair).
+
+By default the local stand-in backend (`standin.py`) is used, such that no
+PDK is required. Pass `--backend hace` to benchmark against the simulator.
+"""
+
+import os
+import sys
+import json
+import time
+import tempfile
+import argparse
+import threading
+import numpy as np
+
+def run_client( address, group: str, num_envs: int, duration: float
+              , results: dict, name: str ):
+    from gace.envs.server import RemoteVecACE
+    client = RemoteVecACE(address, group, num_envs, auto_reset = True)
+    client.reset()
+    steps, tic = 0, time.perf_counter()
+    while time.perf_counter() - tic < duration:
+        client.random_step()
+        steps += 1
+    results[name] = steps * num_envs / (time.perf_counter() - tic)
+    client.close()
+
+def main():
+    parser = argparse.ArgumentParser(description = 'GACE env server benchmark.')
+    parser.add_argument('--env-id', type = str, default = 'op2-xh035-v1')
+    parser.add_argument('--clients', type = int, default = 4)
+    parser.add_argument('--envs-per-client', type = int, default = 2)
+    parser.add_argument('--duration', type = float, default = 5.0)
+    parser.add_argument('--num-workers', type = int, default = 2)
+    parser.add_argument('--unix', action = 'store_true'
+                       , help = 'Use a unix socket instead of TCP.')
+    parser.add_argument('--backend', choices = ['standin', 'hace'], default = 'standin')
+    parser.add_argument('--latency', type = float, default = 0.01
+                       , help = 'Seconds per simulation of the stand-in backend.')
+    args = parser.parse_args()
+
+    env_kwargs = {}
+    if args.backend == 'standin':
+        sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+        import standin
+        standin.install(latency = args.latency)
+        if args.env_id.endswith(('v0', 'v2')):
+            env_kwargs = standin.primitive_models(tempfile.mkdtemp())
+
+    import gym
+    from gace.envs.server import EnvServer
+
+    num_envs = args.clients * args.envs_per_client
+    envs     = { args.env_id: [ gym.make(f'gace:{args.env_id}', **env_kwargs).unwrapped
+                                for _ in range(num_envs) ] }
+    address  = os.path.join(tempfile.mkdtemp(), 'gace.sock') if args.unix \
+                else ('127.0.0.1', 0)
+    results  = {}
+
+    with EnvServer(envs, address, num_workers = args.num_workers) as server:
+        clients = [ threading.Thread( target = run_client
+                                    , args = ( server.address, args.env_id
+                                             , args.envs_per_client, args.duration
+                                             , results, f'client-{i}' ) )
+                    for i in range(args.clients) ]
+        for c in clients: c.start()
+        for c in clients: c.join()
+
+    rates = np.array(list(results.values()))
+    print(json.dumps({ 'env-id':   args.env_id
+                     , 'backend':  args.backend
+                     , 'clients':  results
+                     , 'total':    float(rates.sum())
+                     , 'fairness': float(rates.min() / rates.max())
+                     , }, indent = 2))
+
+if __name__ == '__main__':
+    main()
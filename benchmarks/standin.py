@@ -0,0 +1,243 @@
+"""
+Local stand-in for the `hace` backend, such that gace environments can be
+benchmarked without a PDK or simulator. It implements the subset of the hace
+interface used by gace. Performances are a smooth, deterministic function of
+the sizing around the nominal target of each circuit, simulation latency can
+be emulated with a fixed delay per simulation.
+
+    import standin
+    standin.install(latency = 0.01)  # before any gace env is created
+    import gym, gace
+    env = gym.make('gace:op2-xh035-v1')
+
+v0 and v2 environments additionally need primitive device models, which can
+be generated with `primitive_models(path)`, see `benchmarks/throughput.py`.
+"""
+
+import os
+import sys
+import json
+import time
+import zlib
+import numpy as np
+
+LATENCY = 0.0
+
+# Sizing parameters as specified in the netlist of each circuit.
+SIZING = { 'op1':   [ 'Ld', 'Lcm1', 'Lcm2', 'Lcs', 'Lres', 'Wd', 'Wcm1', 'Wcm2'
+                    , 'Wcs', 'Wres', 'Wcap', 'Md', 'Mcm11', 'Mcm21', 'Mcs'
+                    , 'Mcap', 'Mcm12', 'Mcm22', 'Mcm13' ]
+         , 'op2':   [ 'Ld', 'Lcm1', 'Lcm2', 'Lcm3', 'Wd', 'Wcm1', 'Wcm2', 'Wcm3'
+                    , 'Md', 'Mcm11', 'Mcm21', 'Mcm31', 'Mcm12', 'Mcm22', 'Mcm32' ]
+         , 'op3':   [ 'Ld', 'Lcm1', 'Lcm2', 'Lcm3', 'Wd', 'Wcm1', 'Wcm2', 'Wcm3'
+                    , 'Md', 'Mcm11', 'Mcm2x1', 'Mcm31', 'Mcm12', 'Mcm212'
+                    , 'Mcm32', 'Mcm222' ]
+         , 'op4':   [ 'Ld', 'Lcm1', 'Lcm2', 'Lcm3', 'Lc1', 'Lr', 'Wd', 'Wcm1'
+                    , 'Wcm2', 'Wcm3', 'Wc1', 'Wr', 'Md', 'Mcm11', 'Mcm21'
+                    , 'Mcm31', 'Mc1', 'Mcm12', 'Mcm22', 'Mcm32', 'Mcm13' ]
+         , 'op5':   [ 'Ld', 'Lcm1', 'Lcm2', 'Lcm3', 'Lc1', 'Lr', 'Wd', 'Wcm1'
+                    , 'Wcm2', 'Wcm3', 'Wc1', 'Wr', 'Md', 'Mcm11', 'Mcm212'
+                    , 'Mcm31', 'Mc11', 'Mcm12', 'Mcm222', 'Mcm32', 'Mc12'
+                    , 'Mcm13', 'Mcm2x1' ]
+         , 'op6':   [ 'Ld', 'Lcm1', 'Lcm2', 'Lr1', 'Lc1', 'Lcs', 'Wd', 'Wcm1'
+                    , 'Wcm2', 'Wcs', 'Wr1', 'Wc1', 'Md', 'Mcm11', 'Mcm21', 'Mcs'
+                    , 'Mr1', 'Mc1', 'Mcm12', 'Mcm22', 'Mcm13' ]
+         , 'op8':   [ 'Ld1', 'Lcm1', 'Lcm2', 'Lcm3', 'Lcm4', 'Lcm5', 'Wd1', 'Wcm1'
+                    , 'Wcm2', 'Wcm3', 'Wcm4', 'Wcm5', 'Md1', 'Mcm1', 'Mcm2'
+                    , 'Mcm3', 'Mcm41', 'Mcm51', 'Mcm42', 'Mcm52', 'Mcm43'
+                    , 'Mcm53' ]
+         , 'op9':   [ 'Ld1', 'Lcm1', 'Lcm2', 'Lcm3', 'Lcm4', 'Lls1', 'Lr1', 'Lr2'
+                    , 'Wd1', 'Wcm1', 'Wcm2', 'Wcm3', 'Wcm4', 'Wls1', 'Wr2', 'Wr1'
+                    , 'Md1', 'Mcm1', 'Mcm2', 'Mcm31', 'Mcm41', 'Mls1', 'Mcm32'
+                    , 'Mcm42', 'Mcm33', 'Mcm43', 'Mcm34', 'Mcm44' ]
+         , 'nand4': [ 'Wn0', 'Wp', 'Wn2', 'Wn1', 'Wn3' ]
+         , 'st1':   [ 'Wp0', 'Wn0', 'Wp2', 'Wp1', 'Wn2', 'Wn1' ]
+         , }
+
+# Design constraints by the first letter of a sizing parameter.
+CONSTRAINTS = { 'W': {'init': 5.0e-6, 'min': 0.4e-6,  'max': 150.0e-6, 'grid': 1.0e-7}
+              , 'L': {'init': 1.0e-6, 'min': 0.35e-6, 'max': 15.0e-6,  'grid': 1.0e-7}
+              , 'M': {'init': 2.0,     'min': 1.0,     'max': 20.0,     'grid': 1.0}
+              , }
+
+# Operating point quantities reported for each device.
+OPERATING_POINT = { 'gmoverid': 10.0, 'fug': 1.0e8, 'id': 1.0e-5, 'gm': 1.0e-4
+                  , 'gds': 1.0e-6, 'vdsat': 0.15, 'vgs': 0.6, 'vds': 0.8 }
+
+ANALYSES = { 'op':  ['dcop', 'dcmatch', 'stb', 'tran', 'noise', 'dc1', 'xf', 'ac']
+           , 'nand4': ['tran']
+           , 'st1': ['dc', 'tran'] }
+
+# Analysis producing a performance, by prefix of op amp performance identifiers.
+PRODUCED_BY = { 'a_0': 'stb', 'ugbw': 'stb', 'pm': 'stb', 'gm': 'stb', 'cof': 'ac'
+              , 'sr_': 'tran', 'overshoot': 'tran', 'vn_': 'noise', 'psrr': 'xf'
+              , 'cmrr': 'xf', 'v_': 'dc1', 'i_out': 'dc1', 'voff_stat': 'dcmatch'
+              , 'A': 'dcmatch', }
+
+def analysis(ace_id: str, perf_id: str) -> str:
+    """
+    Returns the analysis, which produces the given performance.
+    """
+    if not ace_id.startswith('op'):
+        return ANALYSES[ace_id][-1]
+    if '/' in perf_id:
+        return 'dcmatch'
+    return next( (a for p,a in PRODUCED_BY.items() if perf_id.startswith(p))
+               , 'dcop' )
+
+class StandInEnv:
+    """
+    Stand-in for a single ace environment.
+    """
+    def __init__(self, ace_id: str, ace_backend: str):
+        # Deferred, since gace.util imports this module as hace.
+        from gace.util.target import target_specification, reward_condition
+        from gace.util.func import input_parameters
+
+        self.ace_id      = ace_id
+        self.ace_backend = ace_backend
+        vdd              = float(ace_backend.split('-')[-1].replace('V', '.'))
+        supply           = 'vsup' if ace_id.startswith('op') else 'vdd'
+        self.parameters  = { **{p: dict(CONSTRAINTS[p[0]]) for p in SIZING[ace_id]}
+                           , supply: {'init': vdd, 'min': vdd, 'max': vdd, 'grid': 0.1}
+                           , 'i0':   {'init': 3.0e-6, 'min': 3.0e-6, 'max': 3.0e-6, 'grid': 1.0e-7}
+                           , 'cl':   {'init': 5.0e-12, 'min': 5.0e-12, 'max': 5.0e-12, 'grid': 1.0e-13}
+                           , }
+        self.sizing_ids  = SIZING[ace_id]
+
+        nominal          = target_specification( ace_id, self.parameters, []
+                                               , random = False, noisy = False )
+        devices          = sorted({ p.split(':')[0]
+                                    for p in (input_parameters(self, ace_id, 0)
+                                              if ace_id.startswith('op') else [])
+                                    if ':' in p })
+        self.nominal     = { **{p: nominal.get(p, 1.0) for p in reward_condition(ace_id)}
+                           , **{ f'{d}:{q}': v for d in devices
+                                               for q,v in OPERATING_POINT.items() }
+                           , }
+        self.perf_ids    = sorted(self.nominal.keys())
+
+        rng              = np.random.default_rng(zlib.crc32(ace_id.encode()))
+        self.weights     = rng.normal(0.0, 1.0, (len(self.perf_ids), len(self.sizing_ids)))
+        self.sizing      = initial_sizing(self)
+        self.performance = self.simulate(self.sizing)
+
+    def simulate(self, sizing: dict) -> dict:
+        z = np.array([ (sizing.get(p, c['init']) - c['init']) / (c['max'] - c['min'])
+                       for p,c in ((p, self.parameters[p]) for p in self.sizing_ids) ])
+        v = np.array([self.nominal[p] for p in self.perf_ids])
+        return dict(zip(self.perf_ids, (v * (1.0 + 0.25 * np.tanh(self.weights @ z))).tolist()))
+
+    def blocked(self, performance: dict, blocklist: list) -> dict:
+        return { p: v for p,v in performance.items()
+                 if analysis(self.ace_id, p) not in blocklist }
+
+    def clear(self):
+        pass
+
+def install(latency: float = 0.0):
+    """
+    Registers this module as `hace`. Must be called before any gace env is
+    created. Every simulation takes at least `latency` seconds.
+    """
+    global LATENCY
+    LATENCY = latency
+    sys.modules['hace'] = sys.modules[__name__]
+
+def make_env(ace_id: str, ace_backend: str, pdk = None, ckt = None, sim = None):
+    return StandInEnv(ace_id, ace_backend)
+
+def make_same_env_pool(num_envs: int, ace_id: str, ace_backend: str, pdk = None
+                      , ckt = None, sims = None):
+    return {i: StandInEnv(ace_id, ace_backend) for i in range(num_envs)}
+
+def evaluate_circuit(ace: StandInEnv, params: dict = None, blocklist: list = []):
+    time.sleep(LATENCY)
+    ace.sizing      = {**ace.sizing, **(params or {})}
+    ace.performance = ace.blocked(ace.simulate(ace.sizing), blocklist)
+    return ace.performance
+
+def evaluate_circuit_pool(envs: dict, pool_params: dict = None, npar: int = 1):
+    pool_params = pool_params or {}
+    time.sleep(LATENCY * np.ceil(len(envs) / max(npar, 1)))
+    for i,e in envs.items():
+        e.sizing      = {**e.sizing, **pool_params.get(i, {})}
+        e.performance = e.simulate(e.sizing)
+    return {i: e.performance for i,e in envs.items()}
+
+def current_performance(ace: StandInEnv) -> dict:
+    return dict(ace.performance)
+
+def current_sizing(ace: StandInEnv) -> dict:
+    return dict(ace.sizing)
+
+def current_sizing_pool(envs: dict) -> dict:
+    return {i: current_sizing(e) for i,e in envs.items()}
+
+def initial_sizing(ace: StandInEnv) -> dict:
+    return {p: ace.parameters[p]['init'] for p in ace.sizing_ids}
+
+def random_sizing(ace: StandInEnv) -> dict:
+    return { p: float(np.round(np.random.uniform(c['min'], c['max']) / c['grid']) * c['grid'])
+             for p,c in ((p, ace.parameters[p]) for p in ace.sizing_ids) }
+
+def parameter_dict(ace: StandInEnv) -> dict:
+    return {p: dict(c) for p,c in ace.parameters.items()}
+
+def performance_identifiers(ace: StandInEnv, blocklist: list = []) -> list:
+    return [p for p in ace.perf_ids if analysis(ace.ace_id, p) not in blocklist]
+
+def sizing_identifiers(ace: StandInEnv) -> list:
+    return list(ace.sizing_ids)
+
+def simulation_analyses(ace: StandInEnv) -> list:
+    return ANALYSES['op' if ace.ace_id.startswith('op') else ace.ace_id]
+
+def scale_factor(ace: StandInEnv) -> float:
+    return 1.0
+
+def dump_state(ace: StandInEnv, file_name: str = None) -> dict:
+    state = {**ace.sizing, **ace.performance}
+    if file_name:
+        with open(file_name, 'w') as f:
+            json.dump(state, f)
+    return state
+
+class AffineScaler:
+    """
+    Stand-in for the scalers of primitive device models: X′ = (X - a) / b.
+    """
+    def __init__(self, offset, scale):
+        self.offset = np.array(offset)
+        self.scale  = np.array(scale)
+
+    def transform(self, X):
+        return (X - self.offset) / self.scale
+
+    def inverse_transform(self, Y):
+        return Y * self.scale + self.offset
+
+def primitive_models(path: str) -> dict:
+    """
+    Writes small TorchScript models and scalers for nmos and pmos devices to
+    `path`, such that v0 and v2 envs can be created with the returned
+    `nmos_path` and `pmos_path` keyword arguments.
+    """
+    import torch
+    import joblib
+
+    torch.manual_seed(666)
+    paths = {}
+    for dev in ['nmos', 'pmos']:
+        dev_path = os.path.join(path, dev)
+        os.makedirs(dev_path, exist_ok = True)
+        model = torch.nn.Sequential(torch.nn.Linear(4, 4), torch.nn.Sigmoid())
+        torch.jit.script(model).save(os.path.join(dev_path, 'model.pt'))
+        # Inputs: gmoverid, log10(fug), Vds, Vbs
+        joblib.dump( AffineScaler([5.0, 6.0, -2.0, -2.0], [10.0, 4.0, 4.0, 4.0])
+                   , os.path.join(dev_path, 'scale.X') )
+        # Outputs: log10(idoverw), L, log10(gdsoverw), Vgs
+        joblib.dump( AffineScaler([0.0, 0.35e-6, -2.0, 0.4], [1.0, 2.0e-6, 1.0, 0.6])
+                   , os.path.join(dev_path, 'scale.Y') )
+        paths[f'{dev}_path'] = dev_path
+    return paths
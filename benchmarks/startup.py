@@ -0,0 +1,69 @@
+"""
+Startup time of `import gace` and of loading the circuit module behind an
+environment id. Every measurement runs in a fresh interpreter, such that
+nothing is cached in `sys.modules`.
+
+    $ python benchmarks/startup.py --runs 10 op2-xh035-v0 op2-xh035-v1
+"""
+
+import sys
+import json
+import argparse
+import subprocess
+import numpy as np
+
+HEAVY_MODULES = ['torch', 'pandas', 'joblib', 'precept', 'hace']
+
+IMPORT_GACE = '''
+import sys, time, json
+tic = time.perf_counter()
+import gace
+toc = time.perf_counter()
+print(json.dumps({'time': toc - tic, 'modules': [m for m in HEAVY if m in sys.modules]}))
+'''
+
+LOAD_ENV = '''
+import sys, time, json, gym, gace
+tic = time.perf_counter()
+gym.envs.registration.load(gym.envs.registry.spec(ENV_ID).entry_point)
+toc = time.perf_counter()
+print(json.dumps({'time': toc - tic, 'modules': [m for m in HEAVY if m in sys.modules]}))
+'''
+
+def measure(script: str, runs: int, **params) -> dict:
+    header  = ''.join(f'{k} = {v!r}\n' for k,v in params.items())
+    results = [ json.loads(subprocess.run( [sys.executable, '-c', header + script]
+                                         , check = True, capture_output = True
+                                         , text = True ).stdout)
+                for _ in range(runs) ]
+    times   = np.array([r['time'] for r in results])
+    return { 'mean':    float(np.mean(times))
+           , 'std':     float(np.std(times))
+           , 'min':     float(np.min(times))
+           , 'max':     float(np.max(times))
+           , 'modules': results[-1]['modules']
+           , }
+
+def main():
+    parser = argparse.ArgumentParser(description = 'GACE startup benchmark.')
+    parser.add_argument('env_ids', nargs = '*', default = [])
+    parser.add_argument('--runs', type = int, default = 5)
+    parser.add_argument('--json', action = 'store_true')
+    args = parser.parse_args()
+
+    results = {'import gace': measure(IMPORT_GACE, args.runs, HEAVY = HEAVY_MODULES)}
+    for env_id in args.env_ids:
+        results[f'load {env_id}'] = measure( LOAD_ENV, args.runs
+                                           , HEAVY = HEAVY_MODULES
+                                           , ENV_ID = env_id )
+
+    if args.json:
+        print(json.dumps(results, indent = 2))
+    else:
+        for stage,r in results.items():
+            print( f'{stage:<24} {r["mean"]:8.4f}s ± {r["std"]:.4f}s '
+                 f'(min {r["min"]:.4f}s, max {r["max"]:.4f}s) '
+                 f'loaded: {", ".join(r["modules"]) or "-"}' )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,205 @@
+"""
+Step and reset throughput of gace environments across ids, variants and pool
+sizes. Each configuration is run as a `VecACE` pool with random actions and
+reported as one JSON record per line, such that results of different commits
+can be compared:
+
+    $ python benchmarks/throughput.py --ids 'op2-xh035-*' --pool-sizes 1 16 \\
+                                      --output results.jsonl
+
+Per step, the time spent in each phase is measured:
+  - step-fn:     Converting actions to sizings (incl. primitive devices)
+  - simulation:  Evaluating the circuits (backend)
+  - observation: Recording performances and building observations
+  - reward:      Rewards and target distances
+  - logging:     Data logging
+  - other:       Everything else, i.e. gace-side bookkeeping
+
+By default the local stand-in backend (`standin.py`) is used, such that no
+PDK is required. Pass `--backend hace` to benchmark against the simulator.
+"""
+
+import os
+import sys
+import json
+import time
+import fnmatch
+import tempfile
+import argparse
+import platform
+import subprocess
+import numpy as np
+from functools import wraps
+from collections import defaultdict
+
+PHASES = ['step-fn', 'simulation', 'observation', 'reward', 'logging', 'other']
+
+class PhaseTimer:
+    """
+    Accumulates the time spent in wrapped functions per phase.
+    """
+    def __init__(self):
+        self.elapsed = defaultdict(float)
+
+    def wrap(self, phase: str, fun):
+        @wraps(fun)
+        def timed(*args, **kwargs):
+            tic = time.perf_counter()
+            try:
+                return fun(*args, **kwargs)
+            finally:
+                self.elapsed[phase] += time.perf_counter() - tic
+        return timed
+
+    def reset(self):
+        self.elapsed.clear()
+
+def instrument_modules(timer: PhaseTimer):
+    """
+    Wraps the hot path shared by all pools, such that each phase is timed.
+    Must be called only once.
+    """
+    import gace.envs.vec as vec
+    from gace.util.layout import ObservationLayout
+    from gace.util.logger import DataLogger
+
+    for cls,method in [(ObservationLayout, 'record'), (ObservationLayout, 'observe')]:
+        setattr(cls, method, timer.wrap('observation', getattr(cls, method)))
+    for cls,method in [(DataLogger, 'append'), (DataLogger, 'flush')]:
+        setattr(cls, method, timer.wrap('logging', getattr(cls, method)))
+    vec.pool_target_distance = timer.wrap('reward', vec.pool_target_distance)
+
+def instrument(envs, timer: PhaseTimer):
+    """
+    Wraps the hot path of the given pool, such that each phase is timed.
+    """
+    envs.step_fn_pool          = timer.wrap('step-fn', envs.step_fn_pool)
+    envs.evaluate_circuit_pool = timer.wrap('simulation', envs.evaluate_circuit_pool)
+    # Envs sharing a batched reward must share the wrapper as well.
+    rewards = {}
+    for e in envs.gace_envs:
+        e.reward = rewards.setdefault(id(e.reward), timer.wrap('reward', e.reward))
+        if e.reward_pool is not None:
+            e.reward_pool = rewards.setdefault( id(e.reward_pool)
+                                              , timer.wrap('reward', e.reward_pool) )
+
+def percentiles(x: list) -> dict:
+    return { 'mean': float(np.mean(x)), 'p50': float(np.percentile(x, 50))
+           , 'p99': float(np.percentile(x, 99)), 'max': float(np.max(x)) }
+
+def benchmark( env_id: str, num_envs: int, num_steps: int, num_resets: int
+             , env_kwargs: dict, timer: PhaseTimer ) -> dict:
+    import gace
+
+    envs   = gace.vector_make_same(f'gace:{env_id}', num_envs, **env_kwargs)
+    instrument(envs, timer)
+
+    reset_latency = []
+    for _ in range(num_resets):
+        tic = time.perf_counter()
+        envs.reset()
+        reset_latency.append(time.perf_counter() - tic)
+
+    timer.reset()
+    step_latency = []
+    for _ in range(num_steps):
+        actions = [a.sample() for a in envs.action_space]
+        tic     = time.perf_counter()
+        _,_,don,_ = envs.step(actions)
+        step_latency.append(time.perf_counter() - tic)
+        # Resets of finished envs are not part of the step phases.
+        if any(don):
+            elapsed = dict(timer.elapsed)
+            envs.reset(done_mask = don)
+            timer.elapsed.update(elapsed)
+
+    total  = sum(step_latency)
+    phases = {p: timer.elapsed[p] / num_steps for p in PHASES[:-1]}
+    phases['other'] = max(0.0, total / num_steps - sum(phases.values()))
+    envs.close()
+
+    return { 'steps_per_sec':     num_envs * num_steps / total
+           , 'pool_steps_per_sec': num_steps / total
+           , 'reset_latency':     percentiles(reset_latency)
+           , 'step_latency':      percentiles(step_latency)
+           , 'phases':            phases
+           , }
+
+def gace_ids(patterns: list, variants: list) -> list:
+    import gym
+    import gace
+    ids = [ s.id for s in gym.envs.registry.all()
+            if str(s.entry_point).startswith('gace.envs.') ]
+    return [ i for i in ids
+             if any(fnmatch.fnmatch(i, p) for p in patterns)
+             and int(i.split('-v')[-1]) in variants ]
+
+def commit() -> str:
+    try:
+        return subprocess.run( ['git', 'rev-parse', '--short', 'HEAD']
+                             , cwd = os.path.dirname(os.path.abspath(__file__))
+                             , capture_output = True, text = True
+                             , check = True ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description = 'GACE throughput benchmark.')
+    parser.add_argument('--ids', nargs = '+', default = ['op2-xh035-*'])
+    parser.add_argument('--variants', nargs = '+', type = int, default = [0, 1, 2, 3])
+    parser.add_argument('--pool-sizes', nargs = '+', type = int
+                       , default = [1, 4, 16, 64, 256])
+    parser.add_argument('--steps', type = int, default = 50)
+    parser.add_argument('--resets', type = int, default = 5)
+    parser.add_argument('--backend', choices = ['standin', 'hace'], default = 'standin')
+    parser.add_argument('--latency', type = float, default = 0.0
+                       , help = 'Seconds per simulation of the stand-in backend.')
+    parser.add_argument('--logging', action = 'store_true')
+    parser.add_argument('--output', type = str, default = None
+                       , help = 'Append JSON records to this file.')
+    args = parser.parse_args()
+
+    env_kwargs = {'logging_enabled': args.logging}
+    model_kwargs = {}
+    if args.backend == 'standin':
+        import standin
+        standin.install(latency = args.latency)
+    env_ids = gace_ids(args.ids, args.variants)
+    # Only v0 and v2 envs need primitive device models, which import torch.
+    if args.backend == 'standin' and any(i.endswith(('-v0', '-v2')) for i in env_ids):
+        model_path   = tempfile.mkdtemp(prefix = 'gace-bench-')
+        model_kwargs = standin.primitive_models(model_path)
+
+    meta = { 'commit': commit(), 'backend': args.backend, 'latency': args.latency
+           , 'python': platform.python_version(), 'host': platform.node()
+           , 'steps': args.steps, 'resets': args.resets }
+
+    timer = PhaseTimer()
+    instrument_modules(timer)
+
+    out = open(args.output, 'a') if args.output else None
+    for env_id in env_ids:
+        kwargs = {**env_kwargs, **model_kwargs} if env_id.endswith(('-v0', '-v2')) \
+                 else env_kwargs
+        for num_envs in args.pool_sizes:
+            result = { **meta, 'id': env_id, 'num_envs': num_envs
+                     , **benchmark( env_id, num_envs, args.steps, args.resets
+                                  , kwargs, timer ) }
+            print( f'{env_id:<16} {num_envs:>4} envs: '
+                   f'{result["steps_per_sec"]:10.1f} steps/s, '
+                   f'step p50 {result["step_latency"]["p50"] * 1e3:8.2f}ms '
+                   f'p99 {result["step_latency"]["p99"] * 1e3:8.2f}ms, '
+                   f'reset p50 {result["reset_latency"]["p50"] * 1e3:8.2f}ms | '
+                 + ' '.join( f'{p} {t * 1e3:.2f}ms'
+                             for p,t in result['phases'].items() )
+                 , file = sys.stderr if out is None else sys.stdout )
+            if out:
+                out.write(json.dumps(result) + '\n')
+                out.flush()
+            else:
+                print(json.dumps(result))
+    if out:
+        out.close()
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,29 @@
-# Function for checking custom environments.
-
-from .util import func
-from .util import target
-from .util import render
-from .util.test import check_env
-from .envs.vec import vector_make, vector_make_same
-from .util.func import scale_value, unscale_value
+from importlib import import_module
+
+# Utilities are resolved lazily, such that `import gace` only registers the
+# environments without loading any circuit module or simulator interface.
+#   - check_env: Function for checking custom environments.
+_UTILITIES = { 'func':             ('.util.func',   None)
+             , 'target':           ('.util.target', None)
+             , 'render':           ('.util.render', None)
+             , 'check_env':        ('.util.test',   'check_env')
+             , 'vector_make':      ('.envs.vec',    'vector_make')
+             , 'vector_make_same': ('.envs.vec',    'vector_make_same')
+             , 'vector_make_sharded': ('.envs.shard', 'vector_make_sharded')
+             , 'sweep':            ('.envs.sweep',  'sweep')
+             , 'scale_value':      ('.util.func',   'scale_value')
+             , 'unscale_value':    ('.util.func',   'unscale_value')
+             , }
+
+def __getattr__(name):
+    if name in _UTILITIES:
+        module_name, attribute = _UTILITIES[name]
+        module  = import_module(module_name, __name__)
+        utility = module if attribute is None else getattr(module, attribute)
+        globals()[name] = utility
+        return utility
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
 ## Environment Variants:
 #
 # | Variant | Description                                |
@@ -26,388 +44,388 @@ from gym.envs.registration import register
 
 ## AC²E: OP1 - Miller Amplifier
 register( id          = 'op1-xh035-v0'
-        , entry_point = 'gace.envs:OP1XH035V0Env'
+        , entry_point = 'gace.envs.op1:OP1XH035V0Env'
         , )
 
 register( id          = 'op1-xh035-v1'
-        , entry_point = 'gace.envs:OP1XH035V1Env'
+        , entry_point = 'gace.envs.op1:OP1XH035V1Env'
         , )
 
 register( id          = 'op1-xh035-v3'
-        , entry_point = 'gace.envs:OP1XH035V3Env'
+        , entry_point = 'gace.envs.op1:OP1XH035V3Env'
         , )
 
 register( id          = 'op1-xh018-v0'
-        , entry_point = 'gace.envs:OP1XH018V0Env'
+        , entry_point = 'gace.envs.op1:OP1XH018V0Env'
         , )
 
 register( id          = 'op1-xh018-v1'
-        , entry_point = 'gace.envs:OP1XH018V1Env'
+        , entry_point = 'gace.envs.op1:OP1XH018V1Env'
         , )
 
 register( id          = 'op1-xh018-v3'
-        , entry_point = 'gace.envs:OP1XH018V3Env'
+        , entry_point = 'gace.envs.op1:OP1XH018V3Env'
         , )
 
 #register( id          = 'op1-xt018-v0'
-#        , entry_point = 'gace.envs:OP1XT018V0Env'
+#        , entry_point = 'gace.envs.op1:OP1XT018V0Env'
 #        , )
 #
 #register( id          = 'op1-xt018-v1'
-#        , entry_point = 'gace.envs:OP1XT018V1Env'
+#        , entry_point = 'gace.envs.op1:OP1XT018V1Env'
 #        , )
 
 #register( id          = 'op1-xt018-v3'
-#        , entry_point = 'gace.envs:OP1XT018V3Env'
+#        , entry_point = 'gace.envs.op1:OP1XT018V3Env'
 #        , )
 
 register( id          = 'op1-sky130-v0'
-        , entry_point = 'gace.envs:OP1SKY130V0Env'
+        , entry_point = 'gace.envs.op1:OP1SKY130V0Env'
         , )
 
 register( id          = 'op1-sky130-v1'
-        , entry_point = 'gace.envs:OP1SKY130V1Env'
+        , entry_point = 'gace.envs.op1:OP1SKY130V1Env'
         , )
 
 register( id          = 'op1-sky130-v3'
-        , entry_point = 'gace.envs:OP1SKY130V3Env'
+        , entry_point = 'gace.envs.op1:OP1SKY130V3Env'
         , )
 
 register( id          = 'op1-gpdk180-v0'
-        , entry_point = 'gace.envs:OP1GPDK180V0Env'
+        , entry_point = 'gace.envs.op1:OP1GPDK180V0Env'
         , )
 
 register( id          = 'op1-gpdk180-v1'
-        , entry_point = 'gace.envs:OP1GPDK180V1Env'
+        , entry_point = 'gace.envs.op1:OP1GPDK180V1Env'
         , )
 
 register( id          = 'op1-gpdk180-v3'
-        , entry_point = 'gace.envs:OP1GPDK180V3Env'
+        , entry_point = 'gace.envs.op1:OP1GPDK180V3Env'
         , )
 
 ## AC²E: OP2 - Symmetrical Amplifier
 register( id          = 'op2-xh035-v0'
-        , entry_point = 'gace.envs:OP2XH035V0Env'
+        , entry_point = 'gace.envs.op2:OP2XH035V0Env'
         , )
 
 register( id          = 'op2-xh035-v1'
-        , entry_point = 'gace.envs:OP2XH035V1Env'
+        , entry_point = 'gace.envs.op2:OP2XH035V1Env'
         , )
 
 register( id          = 'op2-xh035-v2'
-        , entry_point = 'gace.envs:OP2XH035V2Env'
+        , entry_point = 'gace.envs.op2:OP2XH035V2Env'
         , )
 
 register( id          = 'op2-xh035-v3'
-        , entry_point = 'gace.envs:OP2XH035V3Env'
+        , entry_point = 'gace.envs.op2:OP2XH035V3Env'
         , )
 
 register( id          = 'op2-xh018-v0'
-        , entry_point = 'gace.envs:OP2XH018V0Env'
+        , entry_point = 'gace.envs.op2:OP2XH018V0Env'
         , )
 
 register( id          = 'op2-xh018-v1'
-        , entry_point = 'gace.envs:OP2XH018V1Env'
+        , entry_point = 'gace.envs.op2:OP2XH018V1Env'
         , )
 
 register( id          = 'op2-xh018-v3'
-        , entry_point = 'gace.envs:OP2XH018V3Env'
+        , entry_point = 'gace.envs.op2:OP2XH018V3Env'
         , )
 
 #register( id          = 'op2-xt018-v0'
-#        , entry_point = 'gace.envs:OP2XT018V0Env'
+#        , entry_point = 'gace.envs.op2:OP2XT018V0Env'
 #        , )
 #
 #register( id          = 'op2-xt018-v1'
-#        , entry_point = 'gace.envs:OP2XT018V1Env'
+#        , entry_point = 'gace.envs.op2:OP2XT018V1Env'
 #        , )
 
 #register( id          = 'op2-xt018-v3'
-#        , entry_point = 'gace.envs:OP2XT018V3Env'
+#        , entry_point = 'gace.envs.op2:OP2XT018V3Env'
 #        , )
 
 register( id          = 'op2-sky130-v0'
-        , entry_point = 'gace.envs:OP2SKY130V0Env'
+        , entry_point = 'gace.envs.op2:OP2SKY130V0Env'
         , )
 
 register( id          = 'op2-sky130-v1'
-        , entry_point = 'gace.envs:OP2SKY130V1Env'
+        , entry_point = 'gace.envs.op2:OP2SKY130V1Env'
         , )
 
 register( id          = 'op2-sky130-v3'
-        , entry_point = 'gace.envs:OP2SKY130V3Env'
+        , entry_point = 'gace.envs.op2:OP2SKY130V3Env'
         , )
 
 register( id          = 'op2-gpdk180-v0'
-        , entry_point = 'gace.envs:OP2GPDK180V0Env'
+        , entry_point = 'gace.envs.op2:OP2GPDK180V0Env'
         , )
 
 register( id          = 'op2-gpdk180-v1'
-        , entry_point = 'gace.envs:OP2GPDK180V1Env'
+        , entry_point = 'gace.envs.op2:OP2GPDK180V1Env'
         , )
 
 register( id          = 'op2-gpdk180-v3'
-        , entry_point = 'gace.envs:OP2GPDK180V3Env'
+        , entry_point = 'gace.envs.op2:OP2GPDK180V3Env'
         , )
 
 ## AC²E: OP3 - Un-Symmetrical Amplifier
 register( id          = 'op3-xh035-v0'
-        , entry_point = 'gace.envs:OP3XH035V0Env'
+        , entry_point = 'gace.envs.op3:OP3XH035V0Env'
         , )
 
 register( id          = 'op3-xh035-v1'
-        , entry_point = 'gace.envs:OP3XH035V1Env'
+        , entry_point = 'gace.envs.op3:OP3XH035V1Env'
         , )
 
 register( id          = 'op3-xh035-v2'
-        , entry_point = 'gace.envs:OP3XH035V2Env'
+        , entry_point = 'gace.envs.op3:OP3XH035V2Env'
         , )
 
 register( id          = 'op3-xh035-v3'
-        , entry_point = 'gace.envs:OP3XH035V3Env'
+        , entry_point = 'gace.envs.op3:OP3XH035V3Env'
         , )
 
 register( id          = 'op3-xh018-v0'
-        , entry_point = 'gace.envs:OP3XH018V0Env'
+        , entry_point = 'gace.envs.op3:OP3XH018V0Env'
         , )
 
 register( id          = 'op3-xh018-v1'
-        , entry_point = 'gace.envs:OP3XH018V1Env'
+        , entry_point = 'gace.envs.op3:OP3XH018V1Env'
         , )
 
 register( id          = 'op3-xh018-v3'
-        , entry_point = 'gace.envs:OP3XH018V3Env'
+        , entry_point = 'gace.envs.op3:OP3XH018V3Env'
         , )
 
 #register( id          = 'op3-xt018-v0'
-#        , entry_point = 'gace.envs:OP3XT018V0Env'
+#        , entry_point = 'gace.envs.op3:OP3XT018V0Env'
 #        , )
 #
 #register( id          = 'op3-xt018-v1'
-#        , entry_point = 'gace.envs:OP3XT018V1Env'
+#        , entry_point = 'gace.envs.op3:OP3XT018V1Env'
 #        , )
 
 #register( id          = 'op3-xt018-v3'
-#        , entry_point = 'gace.envs:OP3XT018V3Env'
+#        , entry_point = 'gace.envs.op3:OP3XT018V3Env'
 #        , )
 
 register( id          = 'op3-sky130-v0'
-        , entry_point = 'gace.envs:OP3SKY130V0Env'
+        , entry_point = 'gace.envs.op3:OP3SKY130V0Env'
         , )
 
 register( id          = 'op3-sky130-v1'
-        , entry_point = 'gace.envs:OP3SKY130V1Env'
+        , entry_point = 'gace.envs.op3:OP3SKY130V1Env'
         , )
 
 register( id          = 'op3-sky130-v3'
-        , entry_point = 'gace.envs:OP3SKY130V3Env'
+        , entry_point = 'gace.envs.op3:OP3SKY130V3Env'
         , )
 
 register( id          = 'op3-gpdk180-v0'
-        , entry_point = 'gace.envs:OP3GPDK180V0Env'
+        , entry_point = 'gace.envs.op3:OP3GPDK180V0Env'
         , )
 
 register( id          = 'op3-gpdk180-v1'
-        , entry_point = 'gace.envs:OP3GPDK180V1Env'
+        , entry_point = 'gace.envs.op3:OP3GPDK180V1Env'
         , )
 
 register( id          = 'op3-gpdk180-v3'
-        , entry_point = 'gace.envs:OP3GPDK180V3Env'
+        , entry_point = 'gace.envs.op3:OP3GPDK180V3Env'
         , )
 
 ## AC²E: OP4 - Symmetrical Cascode Amplifier
 register( id          = 'op4-xh035-v0'
-        , entry_point = 'gace.envs:OP4XH035V0Env'
+        , entry_point = 'gace.envs.op4:OP4XH035V0Env'
         , )
 
 register( id          = 'op4-xh035-v1'
-        , entry_point = 'gace.envs:OP4XH035V1Env'
+        , entry_point = 'gace.envs.op4:OP4XH035V1Env'
         , )
 
 register( id          = 'op4-xh035-v2'
-        , entry_point = 'gace.envs:OP4XH035V2Env'
+        , entry_point = 'gace.envs.op4:OP4XH035V2Env'
         , )
 
 register( id          = 'op4-xh035-v3'
-        , entry_point = 'gace.envs:OP4XH035V3Env'
+        , entry_point = 'gace.envs.op4:OP4XH035V3Env'
         , )
 
 register( id          = 'op4-xh018-v0'
-        , entry_point = 'gace.envs:OP4XH018V0Env'
+        , entry_point = 'gace.envs.op4:OP4XH018V0Env'
         , )
 
 register( id          = 'op4-xh018-v1'
-        , entry_point = 'gace.envs:OP4XH018V1Env'
+        , entry_point = 'gace.envs.op4:OP4XH018V1Env'
         , )
 
 register( id          = 'op4-xh018-v3'
-        , entry_point = 'gace.envs:OP4XH018V3Env'
+        , entry_point = 'gace.envs.op4:OP4XH018V3Env'
         , )
 
 #register( id          = 'op4-xt018-v0'
-#        , entry_point = 'gace.envs:OP4XT018V0Env'
+#        , entry_point = 'gace.envs.op4:OP4XT018V0Env'
 #        , )
 #
 #register( id          = 'op4-xt018-v1'
-#        , entry_point = 'gace.envs:OP4XT018V1Env'
+#        , entry_point = 'gace.envs.op4:OP4XT018V1Env'
 #        , )
 
 #register( id          = 'op4-xt018-v3'
-#        , entry_point = 'gace.envs:OP4XT018V3Env'
+#        , entry_point = 'gace.envs.op4:OP4XT018V3Env'
 #        , )
 
 register( id          = 'op4-sky130-v0'
-        , entry_point = 'gace.envs:OP4SKY130V0Env'
+        , entry_point = 'gace.envs.op4:OP4SKY130V0Env'
         , )
 
 register( id          = 'op4-sky130-v1'
-        , entry_point = 'gace.envs:OP4SKY130V1Env'
+        , entry_point = 'gace.envs.op4:OP4SKY130V1Env'
         , )
 
 register( id          = 'op4-sky130-v3'
-        , entry_point = 'gace.envs:OP4SKY130V3Env'
+        , entry_point = 'gace.envs.op4:OP4SKY130V3Env'
         , )
 
 register( id          = 'op4-gpdk180-v0'
-        , entry_point = 'gace.envs:OP4GPDK180V0Env'
+        , entry_point = 'gace.envs.op4:OP4GPDK180V0Env'
         , )
 
 register( id          = 'op4-gpdk180-v1'
-        , entry_point = 'gace.envs:OP4GPDK180V1Env'
+        , entry_point = 'gace.envs.op4:OP4GPDK180V1Env'
         , )
 
 register( id          = 'op4-gpdk180-v3'
-        , entry_point = 'gace.envs:OP4GPDK180V3Env'
+        , entry_point = 'gace.envs.op4:OP4GPDK180V3Env'
         , )
 
 ## AC²E: OP5 - Un-Symmetrical Cascode Amplifier
 register( id          = 'op5-xh035-v0'
-        , entry_point = 'gace.envs:OP5XH035V0Env'
+        , entry_point = 'gace.envs.op5:OP5XH035V0Env'
         , )
 
 register( id          = 'op5-xh035-v1'
-        , entry_point = 'gace.envs:OP5XH035V1Env'
+        , entry_point = 'gace.envs.op5:OP5XH035V1Env'
         , )
 
 register( id          = 'op5-xh035-v2'
-        , entry_point = 'gace.envs:OP5XH035V2Env'
+        , entry_point = 'gace.envs.op5:OP5XH035V2Env'
         , )
 
 register( id          = 'op5-xh035-v3'
-        , entry_point = 'gace.envs:OP5XH035V3Env'
+        , entry_point = 'gace.envs.op5:OP5XH035V3Env'
         , )
 
 register( id          = 'op5-xh018-v0'
-        , entry_point = 'gace.envs:OP5XH018V0Env'
+        , entry_point = 'gace.envs.op5:OP5XH018V0Env'
         , )
 
 register( id          = 'op5-xh018-v1'
-        , entry_point = 'gace.envs:OP5XH018V1Env'
+        , entry_point = 'gace.envs.op5:OP5XH018V1Env'
         , )
 
 register( id          = 'op5-xh018-v3'
-        , entry_point = 'gace.envs:OP5XH018V3Env'
+        , entry_point = 'gace.envs.op5:OP5XH018V3Env'
         , )
 
 #register( id          = 'op5-xt018-v0'
-#        , entry_point = 'gace.envs:OP5XT018V0Env'
+#        , entry_point = 'gace.envs.op5:OP5XT018V0Env'
 #        , )
 #
 #register( id          = 'op5-xt018-v1'
-#        , entry_point = 'gace.envs:OP5XT018V1Env'
+#        , entry_point = 'gace.envs.op5:OP5XT018V1Env'
 #        , )
 
 #register( id          = 'op5-xt018-v3'
-#        , entry_point = 'gace.envs:OP5XT018V3Env'
+#        , entry_point = 'gace.envs.op5:OP5XT018V3Env'
 #        , )
 
 register( id          = 'op5-sky130-v0'
-        , entry_point = 'gace.envs:OP5SKY130V0Env'
+        , entry_point = 'gace.envs.op5:OP5SKY130V0Env'
         , )
 
 register( id          = 'op5-sky130-v1'
-        , entry_point = 'gace.envs:OP5SKY130V1Env'
+        , entry_point = 'gace.envs.op5:OP5SKY130V1Env'
         , )
 
 register( id          = 'op5-sky130-v3'
-        , entry_point = 'gace.envs:OP5SKY130V3Env'
+        , entry_point = 'gace.envs.op5:OP5SKY130V3Env'
         , )
 
 register( id          = 'op5-gpdk180-v0'
-        , entry_point = 'gace.envs:OP5GPDK180V0Env'
+        , entry_point = 'gace.envs.op5:OP5GPDK180V0Env'
         , )
 
 register( id          = 'op5-gpdk180-v1'
-        , entry_point = 'gace.envs:OP5GPDK180V1Env'
+        , entry_point = 'gace.envs.op5:OP5GPDK180V1Env'
         , )
 
 register( id          = 'op5-gpdk180-v3'
-        , entry_point = 'gace.envs:OP5GPDK180V3Env'
+        , entry_point = 'gace.envs.op5:OP5GPDK180V3Env'
         , )
 
 ## AC²E: OP6 - Miller Amplifier w/o passives
 register( id          = 'op6-xh035-v0'
-        , entry_point = 'gace.envs:OP6XH035V0Env'
+        , entry_point = 'gace.envs.op6:OP6XH035V0Env'
         , )
 
 register( id          = 'op6-xh035-v1'
-        , entry_point = 'gace.envs:OP6XH035V1Env'
+        , entry_point = 'gace.envs.op6:OP6XH035V1Env'
         , )
 
 register( id          = 'op6-xh035-v2'
-        , entry_point = 'gace.envs:OP6XH035V2Env'
+        , entry_point = 'gace.envs.op6:OP6XH035V2Env'
         , )
 
 register( id          = 'op6-xh035-v3'
-        , entry_point = 'gace.envs:OP6XH035V3Env'
+        , entry_point = 'gace.envs.op6:OP6XH035V3Env'
         , )
 
 register( id          = 'op6-xh018-v0'
-        , entry_point = 'gace.envs:OP6XH018V0Env'
+        , entry_point = 'gace.envs.op6:OP6XH018V0Env'
         , )
 
 register( id          = 'op6-xh018-v1'
-        , entry_point = 'gace.envs:OP6XH018V1Env'
+        , entry_point = 'gace.envs.op6:OP6XH018V1Env'
         , )
 
 register( id          = 'op6-xh018-v3'
-        , entry_point = 'gace.envs:OP6XH018V3Env'
+        , entry_point = 'gace.envs.op6:OP6XH018V3Env'
         , )
 
 #register( id          = 'op6-xt018-v0'
-#        , entry_point = 'gace.envs:OP6XT018V0Env'
+#        , entry_point = 'gace.envs.op6:OP6XT018V0Env'
 #        , )
 #
 #register( id          = 'op6-xt018-v1'
-#        , entry_point = 'gace.envs:OP6XT018V1Env'
+#        , entry_point = 'gace.envs.op6:OP6XT018V1Env'
 #        , )
 
 #register( id          = 'op6-xt018-v3'
-#        , entry_point = 'gace.envs:OP6XT018V3Env'
+#        , entry_point = 'gace.envs.op6:OP6XT018V3Env'
 #        , )
 
 register( id          = 'op6-sky130-v0'
-        , entry_point = 'gace.envs:OP6SKY130V0Env'
+        , entry_point = 'gace.envs.op6:OP6SKY130V0Env'
         , )
 
 register( id          = 'op6-sky130-v1'
-        , entry_point = 'gace.envs:OP6SKY130V1Env'
+        , entry_point = 'gace.envs.op6:OP6SKY130V1Env'
         , )
 
 register( id          = 'op6-sky130-v3'
-        , entry_point = 'gace.envs:OP6SKY130V3Env'
+        , entry_point = 'gace.envs.op6:OP6SKY130V3Env'
         , )
 
 register( id          = 'op6-gpdk180-v0'
-        , entry_point = 'gace.envs:OP6GPDK180V0Env'
+        , entry_point = 'gace.envs.op6:OP6GPDK180V0Env'
         , )
 
 register( id          = 'op6-gpdk180-v1'
-        , entry_point = 'gace.envs:OP6GPDK180V1Env'
+        , entry_point = 'gace.envs.op6:OP6GPDK180V1Env'
         , )
 
 register( id          = 'op6-gpdk180-v3'
-        , entry_point = 'gace.envs:OP6GPDK180V3Env'
+        , entry_point = 'gace.envs.op6:OP6GPDK180V3Env'
         , )
 
 ## AC²E: OP7
@@ -415,96 +433,96 @@ register( id          = 'op6-gpdk180-v3'
 
 ## AC²E: OP8 - Wideswing Current Mirror
 register( id          = 'op8-xh035-v0'
-        , entry_point = 'gace.envs:OP8XH035V0Env'
+        , entry_point = 'gace.envs.op8:OP8XH035V0Env'
         , )
 
 register( id          = 'op8-xh035-v1'
-        , entry_point = 'gace.envs:OP8XH035V1Env'
+        , entry_point = 'gace.envs.op8:OP8XH035V1Env'
         , )
 
 register( id          = 'op8-xh035-v2'
-        , entry_point = 'gace.envs:OP8XH035V2Env'
+        , entry_point = 'gace.envs.op8:OP8XH035V2Env'
         , )
 
 register( id          = 'op8-xh035-v3'
-        , entry_point = 'gace.envs:OP8XH035V3Env'
+        , entry_point = 'gace.envs.op8:OP8XH035V3Env'
         , )
 
 register( id          = 'op8-xh018-v0'
-        , entry_point = 'gace.envs:OP8XH018V0Env'
+        , entry_point = 'gace.envs.op8:OP8XH018V0Env'
         , )
 
 register( id          = 'op8-xh018-v1'
-        , entry_point = 'gace.envs:OP8XH018V1Env'
+        , entry_point = 'gace.envs.op8:OP8XH018V1Env'
         , )
 
 register( id          = 'op8-xh018-v3'
-        , entry_point = 'gace.envs:OP8XH018V3Env'
+        , entry_point = 'gace.envs.op8:OP8XH018V3Env'
         , )
 
 #register( id          = 'op8-xt018-v0'
-#        , entry_point = 'gace.envs:OP8XT018V0Env'
+#        , entry_point = 'gace.envs.op8:OP8XT018V0Env'
 #        , )
 #
 #register( id          = 'op8-xt018-v1'
-#        , entry_point = 'gace.envs:OP8XT018V1Env'
+#        , entry_point = 'gace.envs.op8:OP8XT018V1Env'
 #        , )
 
 #register( id          = 'op8-xt018-v3'
-#        , entry_point = 'gace.envs:OP8XT018V3Env'
+#        , entry_point = 'gace.envs.op8:OP8XT018V3Env'
 #        , )
 
 register( id          = 'op8-gpdk180-v0'
-        , entry_point = 'gace.envs:OP8GPDK180V0Env'
+        , entry_point = 'gace.envs.op8:OP8GPDK180V0Env'
         , )
 
 register( id          = 'op8-gpdk180-v1'
-        , entry_point = 'gace.envs:OP8GPDK180V1Env'
+        , entry_point = 'gace.envs.op8:OP8GPDK180V1Env'
         , )
 
 register( id          = 'op8-gpdk180-v3'
-        , entry_point = 'gace.envs:OP8GPDK180V3Env'
+        , entry_point = 'gace.envs.op8:OP8GPDK180V3Env'
         , )
 
 ## AC²E: OP9 - Cascode Wideswing Current Mirror
 register( id          = 'op9-xh035-v0'
-        , entry_point = 'gace.envs:OP9XH035V0Env'
+        , entry_point = 'gace.envs.op9:OP9XH035V0Env'
         , )
 
 register( id          = 'op9-xh035-v1'
-        , entry_point = 'gace.envs:OP9XH035V1Env'
+        , entry_point = 'gace.envs.op9:OP9XH035V1Env'
         , )
 
 register( id          = 'op9-xh035-v2'
-        , entry_point = 'gace.envs:OP9XH035V2Env'
+        , entry_point = 'gace.envs.op9:OP9XH035V2Env'
         , )
 
 register( id          = 'op9-xh035-v3'
-        , entry_point = 'gace.envs:OP9XH035V3Env'
+        , entry_point = 'gace.envs.op9:OP9XH035V3Env'
         , )
 
 register( id          = 'op9-xh018-v0'
-        , entry_point = 'gace.envs:OP9XH018V0Env'
+        , entry_point = 'gace.envs.op9:OP9XH018V0Env'
         , )
 
 register( id          = 'op9-xh018-v1'
-        , entry_point = 'gace.envs:OP9XH018V1Env'
+        , entry_point = 'gace.envs.op9:OP9XH018V1Env'
         , )
 
 #register( id          = 'op9-xt018-v0'
-#        , entry_point = 'gace.envs:OP9XT018V0Env'
+#        , entry_point = 'gace.envs.op9:OP9XT018V0Env'
 #        , )
 #
 #register( id          = 'op9-xt018-v1'
-#        , entry_point = 'gace.envs:OP9XT018V1Env'
+#        , entry_point = 'gace.envs.op9:OP9XT018V1Env'
 #        , )
 
 register( id          = 'op9-gpdk180-v0'
-        , entry_point = 'gace.envs:OP9GPDK180V0Env'
+        , entry_point = 'gace.envs.op9:OP9GPDK180V0Env'
         , )
 
 register( id          = 'op9-gpdk180-v1'
-        , entry_point = 'gace.envs:OP9GPDK180V1Env'
+        , entry_point = 'gace.envs.op9:OP9GPDK180V1Env'
         , )
 
 ## AC²E: OP10
@@ -512,82 +530,82 @@ register( id          = 'op9-gpdk180-v1'
 
 ## AC²E: NAND4 - 4 NAND Gate Inverter Chain
 register( id          = 'nand4-xh035-v1'
-        , entry_point = 'gace.envs:NAND4XH035V1Env'
+        , entry_point = 'gace.envs.nd4:NAND4XH035V1Env'
         , )
 
 register( id          = 'nand4-xh035-v3'
-        , entry_point = 'gace.envs:NAND4XH035V3Env'
+        , entry_point = 'gace.envs.nd4:NAND4XH035V3Env'
         , )
 
 register( id          = 'nand4-xh018-v1'
-        , entry_point = 'gace.envs:NAND4XH018V1Env'
+        , entry_point = 'gace.envs.nd4:NAND4XH018V1Env'
         , )
 
 register( id          = 'nand4-xh018-v3'
-        , entry_point = 'gace.envs:NAND4XH018V3Env'
+        , entry_point = 'gace.envs.nd4:NAND4XH018V3Env'
         , )
 
 register( id          = 'nand4-xt018-v1'
-        , entry_point = 'gace.envs:NAND4XT018V1Env'
+        , entry_point = 'gace.envs.nd4:NAND4XT018V1Env'
         , )
 
 register( id          = 'nand4-xt018-v3'
-        , entry_point = 'gace.envs:NAND4XT018V3Env'
+        , entry_point = 'gace.envs.nd4:NAND4XT018V3Env'
         , )
 
 register( id          = 'nand4-sky130-v1'
-        , entry_point = 'gace.envs:NAND4SKY130V1Env'
+        , entry_point = 'gace.envs.nd4:NAND4SKY130V1Env'
         , )
 
 register( id          = 'nand4-sky130-v3'
-        , entry_point = 'gace.envs:NAND4SKY130V3Env'
+        , entry_point = 'gace.envs.nd4:NAND4SKY130V3Env'
         , )
 
 register( id          = 'nand4-gpdk180-v1'
-        , entry_point = 'gace.envs:NAND4GPDK180V1Env'
+        , entry_point = 'gace.envs.nd4:NAND4GPDK180V1Env'
         , )
 
 register( id          = 'nand4-gpdk180-v3'
-        , entry_point = 'gace.envs:NAND4GPDK180V3Env'
+        , entry_point = 'gace.envs.nd4:NAND4GPDK180V3Env'
         , )
 
 ## AC²E: ST1 - Schmitt Trigger
 register( id          = 'st1-xh035-v1'
-        , entry_point = 'gace.envs:ST1XH035V1Env'
+        , entry_point = 'gace.envs.st1:ST1XH035V1Env'
         , )
 
 register( id          = 'st1-xh035-v3'
-        , entry_point = 'gace.envs:ST1XH035V3Env'
+        , entry_point = 'gace.envs.st1:ST1XH035V3Env'
         , )
 
 register( id          = 'st1-xh018-v1'
-        , entry_point = 'gace.envs:ST1XH018V1Env'
+        , entry_point = 'gace.envs.st1:ST1XH018V1Env'
         , )
 
 register( id          = 'st1-xh018-v3'
-        , entry_point = 'gace.envs:ST1XH018V3Env'
+        , entry_point = 'gace.envs.st1:ST1XH018V3Env'
         , )
 
 register( id          = 'st1-xt018-v1'
-        , entry_point = 'gace.envs:ST1XT018V1Env'
+        , entry_point = 'gace.envs.st1:ST1XT018V1Env'
         , )
 
 register( id          = 'st1-xt018-v3'
-        , entry_point = 'gace.envs:ST1XT018V3Env'
+        , entry_point = 'gace.envs.st1:ST1XT018V3Env'
         , )
 
 register( id          = 'st1-sky130-v1'
-        , entry_point = 'gace.envs:ST1SKY130V1Env'
+        , entry_point = 'gace.envs.st1:ST1SKY130V1Env'
         , )
 
 register( id          = 'st1-sky130-v3'
-        , entry_point = 'gace.envs:ST1SKY130V3Env'
+        , entry_point = 'gace.envs.st1:ST1SKY130V3Env'
         , )
 
 register( id          = 'st1-gpdk180-v1'
-        , entry_point = 'gace.envs:ST1GPDK180V1Env'
+        , entry_point = 'gace.envs.st1:ST1GPDK180V1Env'
         , )
 
 register( id          = 'st1-gpdk180-v3'
-        , entry_point = 'gace.envs:ST1GPDK180V3Env'
+        , entry_point = 'gace.envs.st1:ST1GPDK180V3Env'
         , )
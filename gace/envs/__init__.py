@@ -1,81 +1,101 @@
 import hy
+from importlib import import_module
+
+# Environments are loaded lazily: Accessing e.g. `gace.envs.OP2XH035V1Env`
+# only imports the corresponding circuit module `gace.envs.op2`, which in turn
+# only loads the primitive device models (torch et al.) for v0 and v2.
+_ENVIRONMENTS = {}
 
 # Miller Operational Amplifier
-from gace.envs.op1 import ( OP1XH035V0Env, OP1XH035V1Env, OP1XH035V3Env
-                          , OP1XH018V0Env, OP1XH018V1Env, OP1XH018V3Env
-                          #, OP1XT018V0Env, OP1XT018V1Env, OP1XT018V3Env
-                          , OP1SKY130V0Env, OP1SKY130V1Env, OP1SKY130V3Env
-                          , OP1GPDK180V0Env, OP1GPDK180V1Env, OP1GPDK180V3Env
-                          , )
+_ENVIRONMENTS['op1'] = [ 'OP1XH035V0Env', 'OP1XH035V1Env', 'OP1XH035V3Env'
+                       , 'OP1XH018V0Env', 'OP1XH018V1Env', 'OP1XH018V3Env'
+                       #, 'OP1XT018V0Env', 'OP1XT018V1Env', 'OP1XT018V3Env'
+                       , 'OP1SKY130V0Env', 'OP1SKY130V1Env', 'OP1SKY130V3Env'
+                       , 'OP1GPDK180V0Env', 'OP1GPDK180V1Env', 'OP1GPDK180V3Env'
+                       , ]
 
 # Symmetrical Amplifier
-from gace.envs.op2 import ( OP2XH035V0Env, OP2XH035V1Env, OP2XH035V2Env, OP2XH035V3Env
-                          , OP2XH018V0Env, OP2XH018V1Env, OP2XH018V3Env
-                          #, OP2XT018V0Env, OP2XT018V1Env, OP2XT018V3Env
-                          , OP2SKY130V0Env, OP2SKY130V1Env, OP2SKY130V3Env
-                          , OP2GPDK180V0Env, OP2GPDK180V1Env, OP2GPDK180V3Env
-                          , )
+_ENVIRONMENTS['op2'] = [ 'OP2XH035V0Env', 'OP2XH035V1Env', 'OP2XH035V2Env', 'OP2XH035V3Env'
+                       , 'OP2XH018V0Env', 'OP2XH018V1Env', 'OP2XH018V3Env'
+                       #, 'OP2XT018V0Env', 'OP2XT018V1Env', 'OP2XT018V3Env'
+                       , 'OP2SKY130V0Env', 'OP2SKY130V1Env', 'OP2SKY130V3Env'
+                       , 'OP2GPDK180V0Env', 'OP2GPDK180V1Env', 'OP2GPDK180V3Env'
+                       , ]
 
 # Un-Symmetrical Amplifier
-from gace.envs.op3 import ( OP3XH035V0Env, OP3XH035V1Env, OP3XH035V2Env, OP3XH035V3Env
-                          , OP3XH018V0Env, OP3XH018V1Env, OP3XH018V3Env
-                          #, OP3XT018V0Env, OP3XT018V1Env, OP3XT018V3Env
-                          , OP3SKY130V0Env, OP3SKY130V1Env, OP3SKY130V3Env
-                          , OP3GPDK180V0Env, OP3GPDK180V1Env, OP3GPDK180V3Env
-                          , )
+_ENVIRONMENTS['op3'] = [ 'OP3XH035V0Env', 'OP3XH035V1Env', 'OP3XH035V2Env', 'OP3XH035V3Env'
+                       , 'OP3XH018V0Env', 'OP3XH018V1Env', 'OP3XH018V3Env'
+                       #, 'OP3XT018V0Env', 'OP3XT018V1Env', 'OP3XT018V3Env'
+                       , 'OP3SKY130V0Env', 'OP3SKY130V1Env', 'OP3SKY130V3Env'
+                       , 'OP3GPDK180V0Env', 'OP3GPDK180V1Env', 'OP3GPDK180V3Env'
+                       , ]
 
 # Cascode Symmetrical Amplifier
-from gace.envs.op4 import ( OP4XH035V0Env, OP4XH035V1Env, OP4XH035V2Env, OP4XH035V3Env
-                          , OP4XH018V0Env, OP4XH018V1Env, OP4XH018V3Env
-                          #, OP4XT018V0Env, OP4XT018V1Env, OP4XT018V3Env
-                          , OP4SKY130V0Env, OP4SKY130V1Env, OP4SKY130V3Env
-                          , OP4GPDK180V0Env, OP4GPDK180V1Env, OP4GPDK180V3Env
-                          , )
+_ENVIRONMENTS['op4'] = [ 'OP4XH035V0Env', 'OP4XH035V1Env', 'OP4XH035V2Env', 'OP4XH035V3Env'
+                       , 'OP4XH018V0Env', 'OP4XH018V1Env', 'OP4XH018V3Env'
+                       #, 'OP4XT018V0Env', 'OP4XT018V1Env', 'OP4XT018V3Env'
+                       , 'OP4SKY130V0Env', 'OP4SKY130V1Env', 'OP4SKY130V3Env'
+                       , 'OP4GPDK180V0Env', 'OP4GPDK180V1Env', 'OP4GPDK180V3Env'
+                       , ]
 
 # Cascode Un-Symmetrical Amplifier
-from gace.envs.op5 import ( OP5XH035V0Env, OP5XH035V1Env, OP5XH035V2Env, OP5XH035V3Env
-                          , OP5XH018V0Env, OP5XH018V1Env, OP5XH018V3Env
-                          #, OP5XT018V0Env, OP5XT018V1Env, OP5XT018V3Env
-                          , OP5SKY130V0Env, OP5SKY130V1Env, OP5SKY130V3Env
-                          , OP5GPDK180V0Env, OP5GPDK180V1Env, OP5GPDK180V3Env
-                          , )
+_ENVIRONMENTS['op5'] = [ 'OP5XH035V0Env', 'OP5XH035V1Env', 'OP5XH035V2Env', 'OP5XH035V3Env'
+                       , 'OP5XH018V0Env', 'OP5XH018V1Env', 'OP5XH018V3Env'
+                       #, 'OP5XT018V0Env', 'OP5XT018V1Env', 'OP5XT018V3Env'
+                       , 'OP5SKY130V0Env', 'OP5SKY130V1Env', 'OP5SKY130V3Env'
+                       , 'OP5GPDK180V0Env', 'OP5GPDK180V1Env', 'OP5GPDK180V3Env'
+                       , ]
 
 # Alternative Miller Amplifier (no passives)
-from gace.envs.op6 import ( OP6XH035V0Env, OP6XH035V1Env, OP6XH035V2Env, OP6XH035V3Env
-                          , OP6XH018V0Env, OP6XH018V1Env, OP6XH018V3Env
-                          #, OP6XT018V0Env, OP6XT018V1Env, OP6XT018V3Env
-                          , OP6SKY130V0Env, OP6SKY130V1Env, OP6SKY130V3Env
-                          , OP6GPDK180V0Env, OP6GPDK180V1Env, OP6GPDK180V3Env
-                          , )
+_ENVIRONMENTS['op6'] = [ 'OP6XH035V0Env', 'OP6XH035V1Env', 'OP6XH035V2Env', 'OP6XH035V3Env'
+                       , 'OP6XH018V0Env', 'OP6XH018V1Env', 'OP6XH018V3Env'
+                       #, 'OP6XT018V0Env', 'OP6XT018V1Env', 'OP6XT018V3Env'
+                       , 'OP6SKY130V0Env', 'OP6SKY130V1Env', 'OP6SKY130V3Env'
+                       , 'OP6GPDK180V0Env', 'OP6GPDK180V1Env', 'OP6GPDK180V3Env'
+                       , ]
 
 # Wideswing
-from gace.envs.op8 import ( OP8XH035V0Env, OP8XH035V1Env, OP8XH035V2Env, OP8XH035V3Env
-                          , OP8XH018V0Env, OP8XH018V1Env, OP8XH018V3Env
-                          #, OP8XT018V0Env, OP8XT018V1Env, OP8XT018V3Env
-                          #, OP8SKY130V0Env, OP8SKY130V1Env, OP8SKY130V3Env
-                          , OP8GPDK180V0Env, OP8GPDK180V1Env, OP8GPDK180V3Env
-                          , )
+_ENVIRONMENTS['op8'] = [ 'OP8XH035V0Env', 'OP8XH035V1Env', 'OP8XH035V2Env', 'OP8XH035V3Env'
+                       , 'OP8XH018V0Env', 'OP8XH018V1Env', 'OP8XH018V3Env'
+                       #, 'OP8XT018V0Env', 'OP8XT018V1Env', 'OP8XT018V3Env'
+                       #, 'OP8SKY130V0Env', 'OP8SKY130V1Env', 'OP8SKY130V3Env'
+                       , 'OP8GPDK180V0Env', 'OP8GPDK180V1Env', 'OP8GPDK180V3Env'
+                       , ]
 
 # Cascode Wideswing
-from gace.envs.op9 import ( OP9XH035V0Env, OP9XH035V1Env, OP9XH035V2Env, OP9XH035V3Env
-                          , OP9XH018V0Env, OP9XH018V1Env, OP9XH018V3Env
-                          #, OP9XT018V0Env, OP9XT018V1Env, OP9XT018V3Env
-                          #, OP9SKY130V0Env, OP9SKY130V1Env, OP9SKY130V3Env
-                          , OP9GPDK180V0Env, OP9GPDK180V1Env, OP9GPDK180V3Env
-                          , )
+_ENVIRONMENTS['op9'] = [ 'OP9XH035V0Env', 'OP9XH035V1Env', 'OP9XH035V2Env', 'OP9XH035V3Env'
+                       , 'OP9XH018V0Env', 'OP9XH018V1Env', 'OP9XH018V3Env'
+                       #, 'OP9XT018V0Env', 'OP9XT018V1Env', 'OP9XT018V3Env'
+                       #, 'OP9SKY130V0Env', 'OP9SKY130V1Env', 'OP9SKY130V3Env'
+                       , 'OP9GPDK180V0Env', 'OP9GPDK180V1Env', 'OP9GPDK180V3Env'
+                       , ]
 
 # 4 NAND Gate Inverter Chain
-from gace.envs.nd4 import ( NAND4XH035V1Env, NAND4XH035V3Env
-                          , NAND4XH018V1Env, NAND4XH018V3Env
-                          , NAND4XT018V1Env, NAND4XT018V3Env
-                          , NAND4SKY130V1Env, NAND4SKY130V3Env
-                          , NAND4GPDK180V1Env, NAND4GPDK180V3Env
-                          , )
+_ENVIRONMENTS['nd4'] = [ 'NAND4XH035V1Env', 'NAND4XH035V3Env'
+                       , 'NAND4XH018V1Env', 'NAND4XH018V3Env'
+                       , 'NAND4XT018V1Env', 'NAND4XT018V3Env'
+                       , 'NAND4SKY130V1Env', 'NAND4SKY130V3Env'
+                       , 'NAND4GPDK180V1Env', 'NAND4GPDK180V3Env'
+                       , ]
 
 # Schmitt Trigger
-from gace.envs.st1 import ( ST1XH035V1Env, ST1XH035V3Env
-                          , ST1XH018V1Env, ST1XH018V3Env
-                          , ST1XT018V1Env, ST1XT018V3Env
-                          , ST1SKY130V1Env, ST1SKY130V3Env
-                          , ST1GPDK180V1Env, ST1GPDK180V3Env
-                          , )
+_ENVIRONMENTS['st1'] = [ 'ST1XH035V1Env', 'ST1XH035V3Env'
+                       , 'ST1XH018V1Env', 'ST1XH018V3Env'
+                       , 'ST1XT018V1Env', 'ST1XT018V3Env'
+                       , 'ST1SKY130V1Env', 'ST1SKY130V3Env'
+                       , 'ST1GPDK180V1Env', 'ST1GPDK180V3Env'
+                       , ]
+
+_MODULES = {e: m for m,es in _ENVIRONMENTS.items() for e in es}
+
+__all__ = list(_MODULES.keys())
+
+def __getattr__(name):
+    if name in _MODULES:
+        env = getattr(import_module(f'.{_MODULES[name]}', __name__), name)
+        globals()[name] = env
+        return env
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+def __dir__():
+    return sorted(list(globals().keys()) + __all__)
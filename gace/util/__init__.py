@@ -1,7 +1,24 @@
 import hy
+from importlib import import_module
 
 from . import func
-from . import prim
 from . import test
 from . import render
 from . import target
+from . import cache
+from . import layout
+from . import logger
+from . import session
+from . import metrics
+from . import surrogate
+from . import transitions
+from . import sampler
+from . import spec
+from . import scheduler
+
+# Primitive devices depend on torch, pandas, joblib and precept, and are only
+# loaded on demand, i.e. by v0 and v2 environments.
+def __getattr__(name):
+    if name == 'prim':
+        return import_module('.prim', __name__)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -1,6 +1,26 @@
 import os
+import sys
+import time
+import threading
+import subprocess
 import gym
 import numpy as np
+from fractions import Fraction
+from gace.util.func import limit_denominator, POOL_REWARDS
+from gace.util.target import reward_condition, condition_opcodes
+from gace.util.cache import SimulationCache, source_digest
+from gace.util.metrics import Metrics, aggregate_metrics, text_exposition
+from gace.util.surrogate import Surrogate
+from gace.util.transitions import TransitionRecorder, TransitionReader, transition_fields
+from gace.util.sampler import ResetSampler
+from gace.envs.vec import stack_infos
+from gace.envs.sweep import SweepPlan, shard_range
+from gace.envs.shard import shared_array, decode_action
+from gace.envs.server import encode_message, decode_message, FairScheduler
+from gace.util.spec import SPEC_OVERRIDES, load_specs, clear_specs, merge_constraints
+from gace.util.session import SessionManager, resident_memory
+from gace.util.logger import DataLogger, log_directory
+from gace.util.scheduler import SimulationScheduler, cost_key
 
 HOME = os.path.expanduser('~')
 
@@ -171,3 +191,331 @@ def test_sky130_st_v1():
 
 def test_gpdk180_st_v1():
     _test_inv_v1('gace:st1-gpdk180-v1')
+
+def test_limit_denominator():
+    x = np.random.uniform(0.01, 50.0, 1000)
+    for lim in [1, 4, 16]:
+        num, den = limit_denominator(x, lim)
+        frc = [Fraction(v).limit_denominator(lim) for v in x]
+        assert np.all(num == [f.numerator for f in frc]), \
+               'Numerators differ from Fraction.limit_denominator.'
+        assert np.all(den == [f.denominator for f in frc]), \
+               'Denominators differ from Fraction.limit_denominator.'
+
+def test_reward_pool():
+    cond = { **{p: c for p,c in reward_condition('op2').items() if p in ['a_0', 'vn_1Hz']}
+           , 'vs0': reward_condition('nand4')['vs0'] }
+    opc  = { **{p: c for p,c in condition_opcodes('op2').items() if p in ['a_0', 'vn_1Hz']}
+           , 'vs0': condition_opcodes('nand4')['vs0'] }
+    curr = [ {'a_0': 60.0, 'vn_1Hz': 1e-6, 'vs0': 1.2001, 'M0:fug': 1e8}
+           , {'a_0': 40.0, 'vn_1Hz': 3e-6, 'vs0': 1.5,    'M0:fug': 3e7}
+           , {'a_0': np.nan, 'vn_1Hz': 2e-6, 'vs0': 1.2,  'M0:fug': np.nan}
+           , {'a_0': 55.0, 'vn_1Hz': 1e-6, 'vs0': 0.9,    'M0:fug': 3e8} ]
+    prev = [ {'a_0': 50.0, 'vn_1Hz': 2e-6, 'vs0': 1.3, 'M0:fug': 1e8} ] * 4
+    targ = [{'a_0': 55.0, 'vn_1Hz': 2e-6, 'vs0': 1.2}] * 3 + [{'a_0': 50.0, 'vn_1Hz': 2e-6}]
+    acts = [{'M0:fug': 8.1}, {'M0:fug': 7.5}, {}, {'M0:fug': 8.4}]
+    size = [{'W': 1e-6}] * 4
+    steps, max_steps = [1, 5, 2, 10], [10] * 4
+    names = sorted(curr[0])
+    column = lambda ds, ks: {k: np.array([d.get(k, np.nan) for d in ds]) for k in ks}
+    for scalar, pool in POOL_REWARDS.items():
+        expected = [ scalar(c, p, t, {k: cond[k] for k in t}, s, s, a, n, m)
+                     for c,p,t,a,s,n,m in zip(curr, prev, targ, acts, size, steps, max_steps) ]
+        batched  = pool( column(curr, names), column(prev, names), column(targ, sorted(cond))
+                       , {k: np.array([opc[k] if k in t else np.nan for t in targ]) for k in sorted(cond)}
+                       , size, size, column(acts, ['M0:fug'])
+                       , np.array(steps), np.array(max_steps) )
+        np.testing.assert_allclose( batched, expected, rtol = 1e-9
+                                  , err_msg = f'{pool.__name__} differs from {scalar.__name__}.' )
+
+def test_simulation_cache(tmp_path):
+    dc  = {'W': {'grid': 0.5}}
+    db  = str(tmp_path / 'sim.db')
+    sc  = SimulationCache(max_size = 2, cache_path = db)
+    key = sc.key('op2', 'xh035-3V3', {'W': 1.0}, dc)
+    assert sc.lookup(key) is None, 'Empty cache must miss.'
+    sc.store(key, {'a_0': 42.0}, {'W': 1.0})
+    assert sc.lookup(sc.key('op2', 'xh035-3V3', {'W': 1.1}, dc))[0]['a_0'] == 42.0, \
+           'Sizings on the same grid point must hit.'
+    assert sc.key('op2', 'xh035-3V3', {'W': 1.0}, dc, ['dcmatch']) != key, \
+           'Blocklist must be part of the key.'
+    ckt = tmp_path / 'ckt'
+    ckt.mkdir()
+    (ckt / 'op2.scs').write_text('M0 (d g s b) nmos')
+    src = source_digest((str(ckt), (), None))
+    assert sc.key('op2', 'xh035-3V3', {'W': 1.0}, dc, [], src) != key, \
+           'Source must be part of the key.'
+    (ckt / 'op2.scs').write_text('M0 (d g s b) pmos')
+    assert source_digest((str(ckt), (), None)) != src, \
+           'Changed netlists must change the source.'
+    for w in [2.0, 3.0]:
+        sc.store(sc.key('op2', 'xh035-3V3', {'W': w}, dc), {}, {'W': w})
+    assert key not in sc.entries, 'Least recently used entry must be evicted.'
+    assert SimulationCache(cache_path = db).lookup(key) is not None, \
+           'Persistent tier must survive eviction.'
+    assert sc.stats()['hits'] == 1 and sc.stats()['misses'] == 1
+
+def test_data_logger_parts(tmp_path, monkeypatch):
+    monkeypatch.setattr(os, 'getlogin', lambda: 'gace')
+    assert log_directory('pool') != log_directory('pool'), 'Log directories must be unique.'
+    for _ in range(2):
+        dl = DataLogger(str(tmp_path), log_format = 'hdf5')
+        dl.append('target', {'a_0': 1.0})
+        dl.close()
+    assert sorted(os.listdir(tmp_path)) == ['target-000000.h5', 'target-000001.h5'], \
+           'Loggers must continue after existing parts.'
+
+def test_lazy_import():
+    code = ( "import sys, gace; "
+             "print(' '.join(m for m in ['torch', 'pandas', 'precept', 'hace', "
+             "'gace.envs.op2'] if m in sys.modules))" )
+    out  = subprocess.run( [sys.executable, '-c', code], check = True
+                         , capture_output = True, text = True ).stdout
+    assert out.strip() == '', f'import gace must not load {out.strip()}.'
+
+def test_metrics():
+    ms = [Metrics(), Metrics()]
+    for i,m in enumerate(ms):
+        with m.timer('simulation'):
+            m.incr('steps', i + 1)
+        m.observe('simulation', 1.0)
+    pool = aggregate_metrics([m.snapshot() for m in ms])
+    assert pool['counters']['steps'] == 3, 'Counters must be summed up.'
+    assert pool['timers']['simulation']['count'] == 4, 'Timer counts must be summed up.'
+    assert pool['timers']['simulation']['max'] == 1.0
+    text = text_exposition({'pool': pool, 'envs': [m.snapshot() for m in ms]})
+    assert 'gace_steps_total{env="pool"} 3' in text
+    assert 'gace_simulation_seconds_count{env="1"} 2' in text
+
+def test_surrogate():
+    srg = Surrogate(min_samples = 32, simulate_every = 0, max_uncertainty = 0.5, seed = 666)
+    rng = np.random.default_rng(666)
+    fun = lambda x: {'a': float(np.sin(x['x'])), 'b': float(x['x'] * x['y'])}
+    for i in range(64):
+        x = {'x': rng.uniform(-1.0, 1.0), 'y': rng.uniform(-1.0, 1.0)}
+        assert (i < 32) or (srg.query(x) is not None), \
+               'Surrogate must answer once enough samples were seen.'
+        assert (i >= 32) or (srg.query(x) is None), \
+               'Surrogate must not answer before min_samples simulations.'
+        srg.add(x, fun(x))
+    perf, unc = srg.query({'x': 0.5, 'y': 0.5})
+    assert abs(perf['a'] - np.sin(0.5)) < 0.1
+    assert srg.query({'x': 0.5}) is None, 'Incomplete sizings must be simulated.'
+
+def test_transitions(tmp_path):
+    path   = str(tmp_path / 'transitions.gtr')
+    fields = transition_fields(3, 2, ['W', 'L'], ['a_0', 'pm'])
+    rec    = TransitionRecorder(path, fields, capacity = 2)
+    for i in range(5):
+        rec.append({ 'obs': np.full(3, i), 'action': [i, -i], 'reward': -i, 'done': i == 4
+                   , 'next-obs': np.full(3, i + 1), 'sizing': {'W': i, 'L': 1.0}
+                   , 'performance': {'a_0': i} })
+    rec.close()
+    data = TransitionReader(path, seed = 666)
+    assert data.size == 5, 'All records must be readable after a resize.'
+    assert np.shares_memory(data['obs'], data.data), 'Fields must be views.'
+    assert np.array_equal(data['action'][:, 1], -np.arange(5))
+    assert np.isnan(data['performance'][:, 1]).all(), 'Missing performances must be NaN.'
+    assert data.columns('sizing') == ['W', 'L']
+    assert sum(len(b['reward']) for b in data.minibatches(2)) == 5
+
+def test_reset_sampler():
+    constraints = { 'vsup': {'init': 3.3, 'min': 3.3, 'max': 3.3, 'grid': 0.1}
+                  , 'Wd':   {'init': 5e-6, 'min': 1e-6, 'max': 1e-4, 'grid': 1e-7}
+                  , 'Md':   {'init': 2.0, 'min': 1.0, 'max': 20.0, 'grid': 1.0} }
+    sampler = ResetSampler('op2', 3, constraints, {'Wd': 5e-6, 'Md': 2.0}, target_filter = ['a_0', 'pm'])
+    draw    = lambda seeds: ( sampler.targets([np.random.default_rng(s) for s in seeds], [True] * len(seeds), [True] * len(seeds))
+                            , sampler.starting_points( [np.random.default_rng(s) for s in seeds], [60] * len(seeds)
+                                                     , [5] * len(seeds), [10] * len(seeds)
+                                                     , [False] * len(seeds), [True] * len(seeds) ) )
+    (t1, p1), (t2, p2) = draw([1, 2, 3]), draw([3, 2, 1])
+    assert t1 == t2[::-1] and p1 == p2[::-1], 'Each env must draw from its own stream.'
+    assert sorted(t1[0]) == ['a_0', 'pm']
+    assert all(p['Md'] in np.arange(1.0, 20.0) for p in p1)
+    _, init = sampler.targets([np.random.default_rng(0)], [False], [False]), \
+              sampler.starting_points([np.random.default_rng(0)], [60], [0], [10], [False], [True])
+    assert init == [{'Wd': 5e-6, 'Md': 2.0}], 'Episodes starting from scratch begin at the initial sizing.'
+
+def test_reset_sampler_sessions(monkeypatch):
+    import gace.util.sampler
+    constraints = {'Wd': {'init': 5e-6, 'min': 1e-6, 'max': 1e-4, 'grid': 1e-7}}
+    monkeypatch.setattr( gace.util.sampler.ac, 'random_sizing'
+                       , lambda ace: {'Wd': ace * 1e-6, 'Ld': 1.0}, raising = False )
+    sampler = ResetSampler('op2', 1, constraints, {'Wd': 5e-6, 'Ld': 1e-6}, nominal = {'a_0': 1.0})
+    points  = sampler.starting_points( [np.random.default_rng(s) for s in [1, 2]], [0, 0], [0, 0]
+                                     , [10, 10], [False, False], [False, False], aces = [3, 7] )
+    assert points == [{'Wd': 3e-6, 'Ld': 1.0}, {'Wd': 7e-6, 'Ld': 1.0}], \
+           'v0/v1 starting points must be drawn by ac.random_sizing.'
+    points  = sampler.starting_points( [np.random.default_rng(1)], [0], [0], [10], [False], [False] )
+    assert points[0]['Ld'] == 1e-6, 'Sizings without constraints must keep their initial value.'
+
+def test_spec_overrides(tmp_path):
+    path = tmp_path / 'specs.json'
+    path.write_text('{"op2": {"xh035-3V3": {"design-constraints": {"Wd": {"max": 5e-5}}}}}')
+    load_specs(str(path))
+    path.write_text('{"op2": {"xh035-3V3": {"target-specification": {"a_0": 60.0}}}}')
+    load_specs(str(path))
+    overrides = SPEC_OVERRIDES[('op2', 'xh035-3V3')]
+    assert overrides['target-specification'] == {'a_0': 60.0}
+    merged = merge_constraints( {'Wd': {'init': 5e-6, 'min': 1e-6, 'max': 1e-4}}
+                              , overrides['design-constraints'] )
+    assert merged == {'Wd': {'init': 5e-6, 'min': 1e-6, 'max': 5e-5}}, \
+           'Overrides must be merged parameter wise.'
+    clear_specs()
+    assert not SPEC_OVERRIDES
+
+def test_shared_buffers():
+    shm, buf = shared_array((4, 3), np.float32)
+    try:
+        view, other = shared_array((4, 3), np.float32, name = shm.name)
+        buf[1] = [1.0, 2.0, 3.0]
+        assert np.all(other[1] == [1.0, 2.0, 3.0]), 'Buffers must be shared.'
+        box = gym.spaces.Box(low = -1.0, high = 1.0, shape = (2,), dtype = np.float32)
+        assert decode_action(gym.spaces.Discrete(5), other[1]) == 1
+        assert decode_action(box, other[1]).tolist() == [1.0, 2.0]
+        view.close()
+    finally:
+        shm.close()
+        shm.unlink()
+
+def test_server_protocol():
+    obs  = np.arange(6, dtype = np.float32).reshape(2, 3)
+    done = np.array([True, False])
+    meta, (o, d) = decode_message(encode_message({'info': [{'a': np.float32(1.5)}]}, [obs, done]))
+    assert meta == {'info': [{'a': 1.5}]}
+    assert o.dtype == np.float32 and np.all(o == obs) and d.tolist() == [True, False]
+
+    scheduler, order = FairScheduler(num_workers = 1), []
+    started, release = threading.Event(), threading.Event()
+    gate = scheduler.submit('a', lambda: (started.set(), release.wait()))
+    started.wait(timeout = 5)
+    jobs = [scheduler.submit(c, order.append, c) for c in 'aaabb']
+    release.set()
+    for j in [gate] + jobs: j.result(timeout = 5)
+    scheduler.shutdown()
+    assert order[:3] == ['a', 'b', 'a'], 'Clients must be served in round robin order.'
+
+def test_session_abandon():
+    class Session:
+        def __init__(self): self.cleared = threading.Event()
+        def clear(self): self.cleared.set()
+    manager = SessionManager(Session)
+    old     = manager.start()
+    manager.abandon()
+    assert manager.stale
+    new = manager.recycle(old)
+    assert new is not old and not manager.stale and manager.recycle_count == 1
+    assert old.cleared.wait(timeout = 5), 'Abandoned sessions must be torn down.'
+    assert manager.recycle(new) is new
+    assert manager.pids == [] and manager.health()['memory-growth'] == 0, \
+           'Only processes spawned by a session count towards its memory.'
+    assert resident_memory([os.getpid()]) > resident_memory([]) == 0
+
+def test_session_teardown():
+    release = threading.Event()
+    class Session:
+        def clear(self): release.wait()
+    manager = SessionManager(Session)
+    old     = manager.start()
+    manager.prepare()
+    manager.replacement.result(timeout = 5)
+    assert manager.recycle(old) is not old
+    manager.prepare()
+    try:
+        assert manager.replacement.result(timeout = 5), \
+               'Spawning must not wait for hung teardowns.'
+    finally:
+        release.set()
+
+def test_simulate_deadlines(monkeypatch):
+    import gace.util.func as func
+    class Backend:
+        @staticmethod
+        def evaluate_circuit(ace, params = None, blocklist = []):
+            if ace is None: raise RuntimeError('Simulator crashed.')
+            time.sleep(ace)
+            return {'a_0': ace}
+    monkeypatch.setattr(func, 'ac', Backend)
+    perfs = func.simulate_deadlines({0: 0.0, 1: 1.0}, {0: {}, 1: {}}, {}, 2, {0: 0.5, 1: 0.2})
+    assert perfs == {0: {'a_0': 0.0}, 1: None}, 'Only expired deadlines are None.'
+    try:
+        func.simulate_deadlines({0: None}, {0: {}}, {}, 1, {0: 0.5})
+        assert False, 'Failed simulations must not be reported as timeouts.'
+    except RuntimeError as e:
+        assert 'crashed' in str(e)
+
+def test_scheduler():
+    scheduler = SimulationScheduler(n_proc = 2, max_proc = 4, adaptive = False)
+    keys      = {0: cost_key('op2'), 1: cost_key('op9'), 2: cost_key('st1'), 3: cost_key('op9', ['dcop'])}
+    scheduler.observe(keys[0], 0.1)
+    scheduler.observe(keys[1], 1.0)
+    scheduler.observe(keys[2], 0.5)
+    scheduler.observe(keys[1], 2.0)
+    assert np.isclose(scheduler.estimate(keys[1]), 1.2)
+    order = list(scheduler.order({i: {} for i in keys}, keys))
+    assert set(order[:2]) == {1, 3} and order[2:] == [2, 0], \
+        'Unknown and expensive circuits must start first.'
+    scheduler.tune(16)
+    assert scheduler.n_proc == 2
+    assert set(scheduler.report()['costs']) == {'op2', 'op9', 'st1'}
+    scheduler.acquire(); scheduler.acquire()
+    third = threading.Thread(target = scheduler.acquire)
+    third.start(); third.join(timeout = 0.1)
+    assert third.is_alive(), 'No more than n_proc simulations may run at a time.'
+    scheduler.release(); third.join(timeout = 5)
+    assert not third.is_alive() and scheduler.active == 2
+
+def test_stack_infos():
+    infos = stack_infos([{'fidelity': 1, 'observations': ('a',)}, {'timeout': True, 'fidelity': 0.5}])
+    assert infos['timeout'].dtype == bool and infos['timeout'].tolist() == [False, True]
+    assert infos['fidelity'].tolist() == [1.0, 0.5]
+    assert infos['observations'] == [('a',), None]
+
+def test_sweep_plan():
+    plan   = SweepPlan('lhs', 3, 50, seed = 1)
+    points = plan.points(0, len(plan))
+    assert np.all((0 <= points) & (points < 1))
+    assert all(sorted(np.floor(points[:,d] * 50).astype(int)) == list(range(50)) for d in range(3)), \
+        'Each stratum must be sampled exactly once.'
+    assert np.allclose(plan.points(20, 30), SweepPlan('lhs', 3, 50, seed = 1).points(20, 30))
+    grid = SweepPlan('grid', 2, 30)
+    assert grid.levels == 5 and len(grid) == 25 and grid.points(24, 25).tolist() == [[1.0, 1.0]]
+    bounds = [shard_range(25, s, 4) for s in range(4)]
+    assert bounds[0][0] == 0 and bounds[-1][1] == 25 and all(a[1] == b[0] for a, b in zip(bounds, bounds[1:]))
+
+def test_batched_v0(tmp_path):
+    bench = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks')
+    code  = ( "import sys, numpy as np; sys.path.insert(0, sys.argv[1]); "
+              "import standin; standin.install(); import gym, gace; "
+              "models = standin.primitive_models(sys.argv[2]); "
+              "[print(a, len(e.size_v0(np.stack([e.action_space.sample() for _ in range(3)]))[0]), "
+              " len(e.candidate_sizings([e.action_space.sample() for _ in range(3)])[0])) "
+              " for a in ['op1','op2','op3','op4','op5','op6','op8','op9'] "
+              " for e in [gym.make(f'gace:{a}-xh035-v0', data_log_path = '', **models).unwrapped]]" )
+    out   = subprocess.run( [sys.executable, '-c', code, bench, str(tmp_path)], check = True
+                          , capture_output = True, text = True ).stdout
+    sizes = [l.split() for l in out.strip().splitlines()]
+    assert [s[0] for s in sizes] == [f'op{op}' for op in [1,2,3,4,5,6,8,9]]
+    assert all(s[1:] == ['3', '3'] for s in sizes), \
+           'Every batched v0 action must be sized.'
+
+def test_auto_reset(tmp_path):
+    bench = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks')
+    code  = ( "import os, sys, numpy as np; sys.path.insert(0, sys.argv[1]); "
+              "os.getlogin = lambda: 'gace'; "
+              "import standin; standin.install(); import gace; "
+              "from gace.envs.vec import vector_make_same; "
+              "envs = vector_make_same('gace:op2-xh035-v1', 2, n_proc = 2, auto_reset = True, "
+              "                        max_steps = 1, data_log_path = ''); "
+              "envs.reset(); "
+              "[print(int(d), int(np.isfinite(r)), int('terminal_observation' in i), "
+              "       int(np.array_equal(o, e.last_obs)), e.num_steps) "
+              " for _ in range(3) "
+              " for o, r, d, i, e in zip(*envs.step([a.sample() for a in envs.action_space]), "
+              "                          envs.gace_envs)]" )
+    out   = subprocess.run( [sys.executable, '-c', code, bench], check = True
+                          , capture_output = True, text = True, cwd = tmp_path ).stdout
+    steps = [l.split() for l in out.strip().splitlines()]
+    assert steps == [['0', '1', '0', '1', '1']] * 2 + [['1', '1', '1', '1', '0']] * 2 \
+                  + [['0', '1', '0', '1', '1']] * 2, \
+           'Finished envs must return their reward and done, followed by the initial observation.'